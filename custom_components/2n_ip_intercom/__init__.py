@@ -1,45 +1,97 @@
 """The 2N IP Intercom integration."""
-import asyncio
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import (
-    CONF_HOST,
-    CONF_PORT,
-    CONF_USERNAME,
-    CONF_PASSWORD,
-    Platform,
-)
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_HOST, Platform
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .coordinator import TwoNIntercomDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    ATTR_DEVICE_ID,
+    ATTR_SWITCHES,
+    ATTR_ACTION,
+    SERVICE_SEND_SWITCH_ACTIONS,
+)
+from .coordinator import STORAGE_VERSION, TwoNIntercomDataUpdateCoordinator
 
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.CAMERA]
 
 _LOGGER = logging.getLogger(__name__)
 
+SEND_SWITCH_ACTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_SWITCHES): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Required(ATTR_ACTION): vol.In(["on", "off"]),
+    }
+)
+
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the 2N IP Intercom component."""
     hass.data[DOMAIN] = {}
+
+    async def async_send_switch_actions(call: ServiceCall) -> None:
+        """Send one action to several switches of a device in one burst."""
+        hosts = set()
+        if device := dr.async_get(hass).async_get(call.data[ATTR_DEVICE_ID]):
+            hosts = {
+                identifier
+                for domain, identifier in device.identifiers
+                if domain == DOMAIN
+            }
+        coordinator = next(
+            (
+                coordinator
+                for coordinator in hass.data[DOMAIN].values()
+                if coordinator.host in hosts
+            ),
+            None,
+        )
+        if coordinator is None:
+            raise HomeAssistantError(
+                f"No 2N IP Intercom found for device {call.data[ATTR_DEVICE_ID]}"
+            )
+
+        action = call.data[ATTR_ACTION]
+        await coordinator.async_send_switch_actions(
+            [(switch_id, action) for switch_id in call.data[ATTR_SWITCHES]]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_SWITCH_ACTIONS,
+        async_send_switch_actions,
+        schema=SEND_SWITCH_ACTIONS_SCHEMA,
+    )
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up 2N IP Intercom from a config entry."""
-    coordinator = TwoNIntercomDataUpdateCoordinator(hass, entry.data)
+    coordinator = TwoNIntercomDataUpdateCoordinator(hass, entry.data, entry.options)
 
     try:
         await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady from err
+    except ConfigEntryNotReady:
+        await coordinator.async_shutdown()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -48,3 +100,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         await coordinator.async_shutdown()
 
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored state of a deleted config entry."""
+    await Store(
+        hass,
+        STORAGE_VERSION,
+        TwoNIntercomDataUpdateCoordinator.storage_key(entry.data[CONF_HOST]),
+    ).async_remove()
@@ -1,7 +1,7 @@
 """Support for 2N IP Intercom camera."""
 from __future__ import annotations
 
-import aiohttp
+import asyncio
 import logging
 
 from homeassistant.components.camera import (
@@ -11,12 +11,24 @@ from homeassistant.components.camera import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    API_CAMERA_SNAPSHOT,
+    RTSP_PORT,
+    RTSP_STREAM_PATH,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a fetched snapshot is served from memory before hitting the device again
+SNAPSHOT_CACHE_TTL = 1.0
+# Upper bound in seconds for the snapshot retry back-off after repeated failures
+SNAPSHOT_MAX_BACKOFF = 60
+# Read size for streaming snapshot bodies into a preallocated buffer
+SNAPSHOT_CHUNK_SIZE = 65536
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -29,60 +41,89 @@ async def async_setup_entry(
         TwoNCamera(coordinator, 1),  # Main camera
     ]
     
-    async_add_entities(cameras, True)
+    async_add_entities(cameras)
 
-class TwoNCamera(Camera):
+class TwoNCamera(CoordinatorEntity, Camera):
     """Implementation of a 2N IP Intercom camera."""
 
     def __init__(self, coordinator, camera_id):
         """Initialize the camera."""
-        super().__init__()
-        self.coordinator = coordinator
+        super().__init__(coordinator)
+        Camera.__init__(self)
         self.camera_id = camera_id
         self._attr_name = f"{coordinator.device_name} Camera {camera_id}"
         self._attr_unique_id = f"{coordinator.host}_camera_{camera_id}"
         self._stream_source = None
         self._last_image = None
+        self._last_image_ts = 0.0
+        self._image_cache_ttl = SNAPSHOT_CACHE_TTL
+        self._inflight: asyncio.Future[bytes | None] | None = None
+        self._consecutive_failures = 0
+        self._next_retry_at = 0.0
         self._attr_supported_features = CameraEntityFeature.STREAM
-        
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.host)},
-            "name": coordinator.device_name,
-            "manufacturer": "2N",
-            "model": "IP Intercom",
+
+        host = coordinator.host
+        auth_string = f"{coordinator.effective_username}:{coordinator.effective_password}@"
+        self._snapshot_url = f"http://{host}{API_CAMERA_SNAPSHOT}"
+        self._rtsp_url = f"rtsp://{auth_string}{host}:{RTSP_PORT}{RTSP_STREAM_PATH}"
+        # Without credentials so they never reach the state machine or recorder
+        self._attrs = {
+            "rtsp_url": f"rtsp://{host}:{RTSP_PORT}{RTSP_STREAM_PATH}",
+            "snapshot_url": self._snapshot_url,
         }
+        
+        self._attr_device_info = coordinator.device_info
 
     async def stream_source(self) -> str | None:
         """Return the RTSP stream source."""
-        auth_string = ""
-        if self.coordinator.username and self.coordinator.password:
-            auth_string = f"{self.coordinator.username}:{self.coordinator.password}@"
-            
-        # 2N devices use port 554 for RTSP by default
-        return f"rtsp://{auth_string}{self.coordinator.host}:554/h264_stream"
+        return self._rtsp_url
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a still image from the camera."""
+        now = self.hass.loop.time()
+        if self._last_image and now - self._last_image_ts < self._image_cache_ttl:
+            return self._last_image
+
+        # Reuse a keyframe from an already running stream rather than asking the
+        # device to encode another JPEG; never start a stream just for a still
+        if self.stream is not None and self.stream.outputs():
+            if image := await self.stream.async_get_image(width, height):
+                return image
+
+        # Back off while the device keeps failing instead of hammering it
+        if now < self._next_retry_at:
+            return self._last_image
+
+        # Collapse concurrent callers into a single upstream fetch
+        if self._inflight is not None and not self._inflight.done():
+            return await asyncio.shield(self._inflight)
+
+        inflight = self._inflight = self.hass.loop.create_future()
+        image = None
         try:
-            websession = async_get_clientsession(self.hass)
-            auth = None
-            if self.coordinator.username and self.coordinator.password:
-                auth = aiohttp.BasicAuth(self.coordinator.username, self.coordinator.password)
-
-            # 2N uses this endpoint for snapshots
-            url = f"http://{self.coordinator.host}/api/camera/snapshot"
-            
+            image = await self._async_fetch_image()
+        finally:
+            inflight.set_result(image)
+            self._inflight = None
+        return image
+
+    async def _async_fetch_image(self) -> bytes | None:
+        """Fetch a fresh snapshot from the device."""
+        try:
+            websession = await self.coordinator.async_get_session()
+
             async with websession.get(
-                url,
-                auth=auth,
-                timeout=10,
+                self._snapshot_url,
                 ssl=False,
             ) as response:
                 if response.status == 200:
-                    return await response.read()
+                    self._last_image = await self._async_read_body(response)
+                    self._last_image_ts = self.hass.loop.time()
+                    self._consecutive_failures = 0
+                    self._next_retry_at = 0.0
+                    return self._last_image
                 elif response.status == 401:
                     _LOGGER.error(
                         "Authentication failed for camera snapshot. Check username/password."
@@ -93,22 +134,40 @@ class TwoNCamera(Camera):
                         self.coordinator.host,
                         response.status,
                     )
-                    
-                try:
-                    error_text = await response.text()
-                    _LOGGER.debug("Error response: %s", error_text)
-                except Exception as e:
-                    _LOGGER.debug("Could not read error response: %s", e)
-                
+
+                # Only pull the error body off the wire when someone will see it
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    try:
+                        error_text = await response.text()
+                        _LOGGER.debug("Error response: %s", error_text)
+                    except Exception as e:
+                        _LOGGER.debug("Could not read error response: %s", e)
+
         except Exception as err:
             _LOGGER.error("Error getting camera image: %s", err)
-            
+
+        self._consecutive_failures += 1
+        self._next_retry_at = self.hass.loop.time() + min(
+            SNAPSHOT_MAX_BACKOFF, 2 ** self._consecutive_failures
+        )
         return None
 
+    @staticmethod
+    async def _async_read_body(response) -> bytes:
+        """Read a snapshot body into a buffer sized from Content-Length."""
+        length = response.content_length
+        if not length:
+            return await response.read()
+
+        view = memoryview(bytearray(length))
+        offset = 0
+        async for chunk in response.content.iter_chunked(SNAPSHOT_CHUNK_SIZE):
+            end = offset + len(chunk)
+            view[offset:end] = chunk
+            offset = end
+        return bytes(view[:offset])
+
     @property
     def extra_state_attributes(self):
         """Return the camera state attributes."""
-        return {
-            "rtsp_url": f"rtsp://{self.coordinator.host}:554/h264_stream",
-            "snapshot_url": f"http://{self.coordinator.host}/api/camera/snapshot",
-        }
+        return self._attrs
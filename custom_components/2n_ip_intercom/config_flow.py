@@ -12,7 +12,9 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_USERNAME,
     CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
 )
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
@@ -21,16 +23,42 @@ from .const import (
     DEFAULT_USERNAME,
     DEFAULT_PASSWORD,
     CONF_NAME,
+    CONF_PARALLEL_REQUESTS,
+    DEFAULT_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+)
+from .coordinator import (
+    CannotConnect,
+    InvalidAuth,
+    TwoNIntercomDataUpdateCoordinator,
 )
-from .coordinator import TwoNIntercomDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Optional(CONF_NAME): str,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+        vol.Optional(CONF_USERNAME, default=DEFAULT_USERNAME): str,
+        vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): str,
+    }
+)
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for 2N IP Intercom."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -38,36 +66,77 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
+            coordinator = TwoNIntercomDataUpdateCoordinator(
+                self.hass,
+                {
+                    CONF_HOST: user_input[CONF_HOST],
+                    CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
+                    CONF_USERNAME: user_input.get(CONF_USERNAME, DEFAULT_USERNAME),
+                    CONF_PASSWORD: user_input.get(CONF_PASSWORD, DEFAULT_PASSWORD),
+                },
+            )
             try:
-                coordinator = TwoNIntercomDataUpdateCoordinator(
-                    self.hass,
-                    {
-                        CONF_HOST: user_input[CONF_HOST],
-                        CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
-                        CONF_USERNAME: user_input.get(CONF_USERNAME, DEFAULT_USERNAME),
-                        CONF_PASSWORD: user_input.get(CONF_PASSWORD, DEFAULT_PASSWORD),
-                    },
-                )
                 await coordinator.async_validate_input()
 
                 return self.async_create_entry(
                     title=user_input.get(CONF_NAME, user_input[CONF_HOST]),
                     data=user_input,
                 )
+            except CannotConnect as err:
+                _LOGGER.warning(
+                    "Cannot connect to %s: %s", user_input[CONF_HOST], err
+                )
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                _LOGGER.warning(
+                    "Invalid credentials for %s", user_input[CONF_HOST]
+                )
+                errors["base"] = "invalid_auth"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
+            finally:
+                await coordinator.async_shutdown()
 
         return self.async_show_form(
             step_id="user",
+            data_schema=STEP_USER_DATA_SCHEMA,
+            errors=errors,
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for 2N IP Intercom."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HOST): str,
-                    vol.Optional(CONF_NAME): str,
-                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-                    vol.Optional(CONF_USERNAME, default=DEFAULT_USERNAME): str,
-                    vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): str,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                        ),
+                    ): vol.All(
+                        int, vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+                    ),
+                    vol.Optional(
+                        CONF_PARALLEL_REQUESTS,
+                        default=self._config_entry.options.get(
+                            CONF_PARALLEL_REQUESTS, False
+                        ),
+                    ): bool,
                 }
             ),
-            errors=errors,
         )
@@ -1,17 +1,38 @@
 """Constants for the 2N IP Intercom integration."""
+import aiohttp
+
 DOMAIN = "2n_ip_intercom"
 
 DEFAULT_PORT = 80
 DEFAULT_USERNAME = "admin"
 DEFAULT_PASSWORD = "2n"
+DEFAULT_SCAN_INTERVAL = 60
+MIN_SCAN_INTERVAL = 5
+MAX_SCAN_INTERVAL = 600
 
 # Configuration keys
 CONF_NAME = "name"
+CONF_PARALLEL_REQUESTS = "parallel_requests"
 
 # API endpoints
 API_SYSTEM_STATUS = "/api/system/info"
+API_SWITCH_CAPS = "/api/switch/caps"
+API_SWITCH_STATUS = "/api/switch/status"
 API_SWITCH_CONTROL = "/api/switch/ctrl"
 API_DOOR_CONTROL = "/api/door/ctrl"
+API_CAMERA_SNAPSHOT = "/api/camera/snapshot"
+
+# 2N devices use port 554 for RTSP by default
+RTSP_PORT = 554
+RTSP_STREAM_PATH = "/h264_stream"
+
+# Separate connect and read budgets so a dead host fails fast while a slow
+# JPEG transfer on a live one still completes
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_connect=3, sock_read=10)
+# Control requests answer with a tiny status body; give up quickly so a
+# button press never hangs on a flaky link. Only socket time is bounded: the
+# wait for the device's single pooled connection must not count against it
+COMMAND_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=2, sock_read=5)
 
 # Available controls
 CONTROL_TYPES = {
@@ -21,3 +42,8 @@ CONTROL_TYPES = {
 
 ATTR_DEVICE_ID = "device_id"
 ATTR_CONTROL_TYPE = "control_type"
+ATTR_SWITCHES = "switches"
+ATTR_ACTION = "action"
+
+# Services
+SERVICE_SEND_SWITCH_ACTIONS = "send_switch_actions"
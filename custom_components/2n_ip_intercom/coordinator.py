@@ -1,106 +1,290 @@
 """DataUpdateCoordinator for 2N IP Intercom integration."""
 import asyncio
 from datetime import timedelta
+import hashlib
+import ipaddress
 import logging
+import random
 
 import aiohttp
+from aiohttp.resolver import AsyncResolver
+from yarl import URL
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util.json import json_loads
 from homeassistant.const import (
     CONF_HOST,
     CONF_PORT,
     CONF_USERNAME,
     CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
 )
 
 from .const import (
     DOMAIN,
     API_SYSTEM_STATUS,
+    API_SWITCH_CAPS,
+    API_SWITCH_STATUS,
+    API_SWITCH_CONTROL,
+    API_DOOR_CONTROL,
+    COMMAND_TIMEOUT,
     CONF_NAME,
+    CONF_PARALLEL_REQUESTS,
+    DEFAULT_USERNAME,
+    DEFAULT_PASSWORD,
+    DEFAULT_SCAN_INTERVAL,
+    REQUEST_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Ceiling in seconds for the poll interval while the device is unreachable
+MAX_FAILURE_BACKOFF = 300
+# Window in which bursts of refresh requests after commands are merged
+REQUEST_REFRESH_COOLDOWN = 0.5
+# Pause before retrying a command whose connection could not be opened
+COMMAND_RETRY_DELAY = 0.25
+# Last known state is kept so entities report something right after a restart
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+# Switch topology rarely changes, so it is re-read far less often than state
+CAPS_REFRESH_INTERVAL = 3600
+
+
+def _parse_switch_caps(caps: dict) -> dict:
+    """Reduce the switch capabilities to the port topology.
+
+    State is deliberately left out: caps are cached between polls and any
+    state they carry would go stale. It comes from the switch status instead.
+    """
+    return {
+        "ports": [
+            {
+                "id": switch.get("id", switch.get("switch")),
+                "name": switch.get("name"),
+                "mode": switch.get("mode"),
+                "enabled": switch.get("enabled", True),
+            }
+            for switch in caps.get("switches", ())
+        ]
+    }
+
+
+def _parse_switch_status(status: dict) -> dict:
+    """Map the live switch status onto switchNState keys."""
+    return {
+        f"switch{switch.get('switch', switch.get('id'))}State": (
+            "on" if switch.get("active") else "off"
+        )
+        for switch in status.get("switches", ())
+    }
+
+
+class CannotConnect(HomeAssistantError):
+    """Error to indicate we cannot connect to the device."""
+
+
+class InvalidAuth(HomeAssistantError):
+    """Error to indicate the device rejected the credentials."""
+
+
 class TwoNIntercomDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the 2N IP Intercom."""
 
-    def __init__(self, hass: HomeAssistant, config: dict):
+    def __init__(
+        self, hass: HomeAssistant, config: dict, options: dict | None = None
+    ):
         """Initialize."""
+        options = options or {}
         self.host = config[CONF_HOST]
         self.port = config.get(CONF_PORT, 80)
         self.username = config.get(CONF_USERNAME)
         self.password = config.get(CONF_PASSWORD)
+        # Resolved once so request paths never re-apply the factory defaults
+        self.effective_username = self.username or DEFAULT_USERNAME
+        self.effective_password = self.password or DEFAULT_PASSWORD
         self.device_name = config.get(CONF_NAME, f"2N IP Intercom ({self.host})")
         self.base_url = f"http://{self.host}:{self.port}"
-        self._session = None
+        try:
+            ipaddress.ip_address(self.host)
+            self._is_ip_literal = True
+        except ValueError:
+            self._is_ip_literal = False
+        self.auth = aiohttp.BasicAuth(self.effective_username, self.effective_password)
+        self._session: aiohttp.ClientSession | None = None
+        self._request_lock = asyncio.Lock()
+        # Parsed once; aiohttp skips its URL parser when handed a URL instance
+        self._base_url = URL(self.base_url)
+        self._status_url = self._base_url.with_path(API_SYSTEM_STATUS)
+        self.switch_url = self._base_url.with_path(API_SWITCH_CONTROL)
+        self.door_url = self._base_url.with_path(API_DOOR_CONTROL)
+        # Authorization is a session default; polls only add the media type
+        self._headers = {"Accept": "application/json"}
+        # Read on every poll; the slow-changing caps are appended when due
+        self._poll_endpoints = (API_SYSTEM_STATUS, API_SWITCH_STATUS)
+        self._endpoints = (*self._poll_endpoints, API_SWITCH_CAPS)
+        # Validators, body digests and last decoded result per endpoint so
+        # unchanged payloads are neither downloaded nor parsed again
+        self._etags: dict[str, str] = {}
+        self._digests: dict[str, bytes] = {}
+        self._results: dict[str, dict] = {}
+        self._caps_next_refresh = 0.0
+        # Rebuilt only when the capabilities body changes
+        self.ports_by_id: dict[int, dict] = {}
+        self._store = Store(hass, STORAGE_VERSION, self.storage_key(self.host))
+        self._endpoint_urls = {
+            path: self._base_url.with_path(path) for path in self._endpoints
+        }
+        self._parallel_requests = options.get(CONF_PARALLEL_REQUESTS, False)
+        # Shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.host)},
+            name=self.device_name,
+            manufacturer="2N",
+            model="IP Intercom",
+        )
+
+        self._base_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._failure_backoff = self._base_interval
+        self._max_backoff = max(MAX_FAILURE_BACKOFF, self._base_interval)
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=timedelta(seconds=self._base_interval),
+            # Unchanged polls should not rewrite every entity's state
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
+    @staticmethod
+    def storage_key(host: str) -> str:
+        """Return the storage key holding the last known state of a device."""
+        return f"{DOMAIN}_{host}"
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh from the device, falling back to its last known state.
+
+        The stored state is only used while the device cannot be reached, so
+        rejected credentials still fail setup. Entities built from it report
+        unavailable until a poll succeeds.
+        """
+        try:
+            await super().async_config_entry_first_refresh()
+        except ConfigEntryNotReady as err:
+            if isinstance(err.__cause__, UpdateFailed) and isinstance(
+                err.__cause__.__cause__, InvalidAuth
+            ):
+                raise
+            if not (cached := await self._store.async_load()):
+                raise
+            _LOGGER.warning(
+                "Could not reach %s (%s); starting from its last known state",
+                self.host,
+                err.__cause__,
+            )
+            self._index_ports(cached.get("ports", ()))
+            self._update_device_info(cached)
+            # Not async_set_updated_data: that would mark the stale state as live
+            self.data = cached
+
+    async def async_get_session(self) -> aiohttp.ClientSession:
+        """Return the session dedicated to this device, creating it on first use.
+
+        The intercom's embedded HTTP server copes badly with many parallel
+        connections, so every request for this device shares one small pool.
+        """
+        if self._session is None or self._session.closed:
+            pool_size = 2 if self._parallel_requests else 1
+            connector_kwargs = {
+                # Only one device is ever reached, so the pool never needs to
+                # be wider than what that device accepts
+                "limit": pool_size,
+                "limit_per_host": pool_size,
+                # Outlive the default poll interval so each poll reuses the socket
+                "keepalive_timeout": 75,
+            }
+            if self._is_ip_literal:
+                # Nothing to resolve for a static LAN address
+                connector_kwargs["use_dns_cache"] = False
+            else:
+                # Resolve on the loop via c-ares instead of a getaddrinfo thread
+                connector_kwargs["resolver"] = AsyncResolver()
+                connector_kwargs["use_dns_cache"] = True
+                connector_kwargs["ttl_dns_cache"] = 600
+            connector = aiohttp.TCPConnector(**connector_kwargs)
+            # Credentials and timeouts apply to every request made for this
+            # device, so they are set here once instead of on each call
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=REQUEST_TIMEOUT,
+                headers={"Authorization": self.auth.encode()},
+            )
+        return self._session
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        await super().async_shutdown()
         if self._session and not self._session.closed:
             await self._session.close()
 
     async def _async_update_data(self):
-        """Update data via API."""
+        """Update data via API, backing off the poll interval while it fails."""
         try:
-            auth = None
-            if self.username and self.password:
-                auth = aiohttp.BasicAuth(self.username, self.password)
+            data = await self._async_fetch_status()
+        except UpdateFailed:
+            self._failure_backoff = min(self._max_backoff, self._failure_backoff * 2)
+            self.update_interval = timedelta(
+                seconds=self._failure_backoff
+                - random.randint(0, self._failure_backoff // 4)
+            )
+            raise
 
-            headers = {
-                "Accept": "application/json",
-                "Connection": "keep-alive"
-            }
+        if self._failure_backoff != self._base_interval:
+            self._failure_backoff = self._base_interval
+            self.update_interval = timedelta(seconds=self._base_interval)
+        return data
 
+    async def _async_fetch_status(self):
+        """Fetch the device status from every read-only endpoint."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Attempting to connect to %s:%s", self.host, self.port)
 
-            try:
-                async with aiohttp.ClientSession() as session:
-                    url = f"{self.base_url}{API_SYSTEM_STATUS}"
-                    _LOGGER.debug("Requesting URL: %s", url)
-
-                    async with session.get(
-                        url,
-                        auth=auth,
-                        headers=headers,
-                        timeout=10,
-                        ssl=False  # Most 2N devices use HTTP
-                    ) as resp:
-                        _LOGGER.debug("Response status: %s", resp.status)
-
-                        if resp.status == 401:
-                            raise UpdateFailed("Invalid authentication credentials")
-                        if resp.status != 200:
-                            content = await resp.text()
-                            _LOGGER.debug("Error response content: %s", content)
-                            raise UpdateFailed(
-                                f"Error communicating with API: Status {resp.status}"
-                            )
-
-                        content = await resp.text()
-                        _LOGGER.debug("Response content: %s", content)
+        now = self.hass.loop.time()
+        refresh_caps = now >= self._caps_next_refresh
+        paths = self._endpoints if refresh_caps else self._poll_endpoints
 
+        try:
+            # The device handles one request at a time; queue rather than race
+            async with self._request_lock:
+                if self._parallel_requests:
+                    results = await asyncio.gather(
+                        *(self._fetch(path) for path in paths),
+                        return_exceptions=True,
+                    )
+                else:
+                    results = [await self._fetch(paths[0])]
+                    for path in paths[1:]:
                         try:
-                            data = await resp.json()
-                            _LOGGER.debug("Parsed JSON data: %s", data)
-                            return data
-                        except ValueError as err:
-                            raise UpdateFailed(f"Invalid JSON response from API: {err}") from err
+                            results.append(await self._fetch(path))
+                        except (UpdateFailed, aiohttp.ClientError, asyncio.TimeoutError) as err:
+                            results.append(err)
 
-            except aiohttp.ClientConnectorError as err:
-                raise UpdateFailed(f"Connection failed to {self.host}:{self.port} - {err}") from err
-            except asyncio.TimeoutError:
-                raise UpdateFailed(f"Timeout connecting to {self.host}:{self.port}") from None
+            # The system endpoint is mandatory; the rest are merged when available
+            if isinstance(results[0], BaseException):
+                raise results[0]
 
         except aiohttp.ClientConnectorError as err:
             raise UpdateFailed(f"Cannot connect to {self.host}:{self.port} - {err}") from err
@@ -109,19 +293,210 @@ class TwoNIntercomDataUpdateCoordinator(DataUpdateCoordinator):
         except asyncio.TimeoutError:
             raise UpdateFailed(f"Timeout connecting to {self.host}:{self.port}") from None
 
-    async def async_validate_input(self) -> bool:
-        """Validate the user input allows us to connect."""
+        fetched = dict(zip(paths, results))
+        caps = fetched.get(API_SWITCH_CAPS)
+        if isinstance(caps, BaseException):
+            _LOGGER.debug("Keeping last known switch topology after error: %s", caps)
+        elif refresh_caps:
+            self._caps_next_refresh = now + CAPS_REFRESH_INTERVAL
+
+        data = {}
+        # Only the topology is carried over between polls; state is always live
+        topology = self._results.get(API_SWITCH_CAPS) or {}
+        if "ports" in topology:
+            data["ports"] = topology["ports"]
+        for path in self._poll_endpoints:
+            result = fetched[path]
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Skipping %s: %s", path, result)
+                continue
+            data.update(result)
+
+        self._update_device_info(data)
+        if data != self.data:
+            self._store.async_delay_save(lambda: self.data, STORAGE_SAVE_DELAY)
+        return data
+
+    async def _fetch(self, path: str) -> dict:
+        """GET one API endpoint and return its decoded result."""
+        session = await self.async_get_session()
+        url = self._endpoint_urls[path]
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Requesting URL: %s", url)
+
+        headers = self._headers
+        # A 304 is only usable while the result it refers to is still held
+        if path in self._results and (etag := self._etags.get(path)):
+            headers = {**headers, "If-None-Match": etag}
+
+        async with session.get(
+            url,
+            headers=headers,
+            ssl=False  # Most 2N devices use HTTP
+        ) as resp:
+            if debug:
+                _LOGGER.debug("Response status: %s", resp.status)
+
+            if resp.status == 304 and path in self._results:
+                return self._results[path]
+            if resp.status == 401:
+                raise UpdateFailed("Invalid authentication credentials") from InvalidAuth()
+            # Releases the connection without reading an error body
+            resp.raise_for_status()
+
+            raw = await resp.read()
+            etag = resp.headers.get("ETag")
+
+        # Identical bytes decode to the same result; skip the parse entirely
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        if digest == self._digests.get(path) and path in self._results:
+            self._store_validator(path, etag)
+            return self._results[path]
+
+        try:
+            data = json_loads(raw)
+        except ValueError as err:
+            raise UpdateFailed(f"Invalid JSON response from API: {err}") from err
+
+        if debug:
+            _LOGGER.debug("Parsed JSON data: %s", data)
+        # 2N wraps payloads as {"success": ..., "result": {...}}
+        if isinstance(data, dict) and isinstance(data.get("result"), dict):
+            data = data["result"]
+        if path == API_SWITCH_STATUS and isinstance(data, dict):
+            data = _parse_switch_status(data)
+        elif path == API_SWITCH_CAPS and isinstance(data, dict):
+            data = _parse_switch_caps(data)
+            self._index_ports(data["ports"])
+
+        self._digests[path] = digest
+        self._results[path] = data
+        self._store_validator(path, etag)
+        return data
+
+    def _store_validator(self, path: str, etag: str | None) -> None:
+        """Remember the ETag that belongs to the cached result of an endpoint."""
+        if etag:
+            self._etags[path] = etag
+        else:
+            self._etags.pop(path, None)
+
+    def _index_ports(self, ports) -> None:
+        """Rebuild the switch id lookup from the enabled ports."""
+        self.ports_by_id = {
+            port["id"]: port
+            for port in ports
+            if port.get("id") is not None and port.get("enabled", True)
+        }
+
+    def _update_device_info(self, data: dict) -> None:
+        """Apply model and firmware details the device has reported.
+
+        Entities are handed the DeviceInfo built from the first refresh; later
+        changes are written to the device registry instead of into that dict.
+        """
+        details = {
+            attr: value
+            for attr, key in (
+                ("model", "variant"),
+                ("sw_version", "swVersion"),
+                ("hw_version", "hwVersion"),
+            )
+            if (value := data.get(key))
+        }
+        if details.items() <= self.device_info.items():
+            return
+        self.device_info = DeviceInfo(**{**self.device_info, **details})
+        registry = dr.async_get(self.hass)
+        if device := registry.async_get_device(identifiers={(DOMAIN, self.host)}):
+            registry.async_update_device(device.id, **details)
+
+    @callback
+    def async_set_optimistic_state(self, key: str, value: str) -> None:
+        """Publish a commanded state until the next poll reports the real one.
+
+        Unlike async_set_updated_data this leaves the poll timer running, and
+        the data is replaced rather than mutated so the next poll compares
+        against the optimistic value and always reaches the entities.
+        """
+        self.data = {**self.data, key: value}
+        self.async_update_listeners()
+
+    async def async_send_command(self, url: URL) -> int:
+        """Send one control request over the device session and return its status."""
+        session = await self.async_get_session()
+        for attempt in range(2):
+            try:
+                # The body is never inspected; leaving the block releases the connection
+                async with session.get(url, timeout=COMMAND_TIMEOUT) as resp:
+                    return resp.status
+            except aiohttp.ClientConnectorError:
+                # Nothing reached the device, so one quick retry is safe
+                if attempt:
+                    raise
+                await asyncio.sleep(COMMAND_RETRY_DELAY)
+
+    async def async_send_switch_actions(self, ops: list[tuple[int, str]]) -> None:
+        """Send several switch commands in turn and refresh once afterwards.
+
+        The device serves one request at a time, so the commands go out back to
+        back rather than queueing on the pool, where the later ones would spend
+        their timeout waiting for a connection.
+        """
+        for switch_id, action in ops:
+            try:
+                status = await self.async_send_command(
+                    self.switch_url.with_query(switch=str(switch_id), action=action)
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.warning(
+                    "Failed to send action '%s' to switch %s: %s",
+                    action,
+                    switch_id,
+                    err,
+                )
+                continue
+            if status != 200:
+                _LOGGER.warning(
+                    "Failed to send action '%s' to switch %s, HTTP status %s",
+                    action,
+                    switch_id,
+                    status,
+                )
+        await self.async_request_refresh()
+
+    async def async_validate_input(self) -> None:
+        """Validate the user input allows us to connect.
+
+        Raises InvalidAuth if the credentials are rejected and CannotConnect
+        if the device cannot be reached or answers with an error.
+        """
+        url = self._status_url
+        session = await self.async_get_session()
         try:
-            async with aiohttp.ClientSession() as session:
-                auth = None
-                if self.username and self.password:
-                    auth = aiohttp.BasicAuth(self.username, self.password)
+            # HEAD proves reachability and auth without transferring the body
+            async with session.head(
+                url,
+                headers=self._headers,
+                allow_redirects=True,
+                ssl=False,
+            ) as resp:
+                status = resp.status
 
+            if status in (405, 501):
+                # Firmware without HEAD support; cap the body at a single byte
                 async with session.get(
-                    f"{self.base_url}{API_SYSTEM_STATUS}",
-                    auth=auth,
+                    url,
+                    headers={**self._headers, "Range": "bytes=0-0"},
+                    ssl=False,
                 ) as resp:
-                    return resp.status == 200
+                    status = resp.status
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise CannotConnect(str(err)) from err
 
-        except aiohttp.ClientError:
-            return False
+        if status == 401:
+            raise InvalidAuth
+        if status not in (200, 204, 206):
+            raise CannotConnect(f"Unexpected status {status}")
@@ -50,12 +50,7 @@ class TwoNIntercomSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.host}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.host)},
-            "name": coordinator.device_name,
-            "manufacturer": "2N",
-            "model": "IP Intercom",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> StateType:
@@ -3,15 +3,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+
 import aiohttp
+from yarl import URL
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN, API_SWITCH_CONTROL, API_DOOR_CONTROL
+from .const import DOMAIN
 from .coordinator import TwoNIntercomDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,82 +28,117 @@ async def async_setup_entry(
     """Set up 2N IP Intercom switches based on a config entry."""
     coordinator: TwoNIntercomDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    switches: list[SwitchEntity] = [
-        TwoNIntercomDoorSwitch(coordinator),
-        TwoNIntercomSwitch(coordinator, 1, f"{coordinator.device_name} Switch 01"),
-        # Test: Always create a Hold switch for Switch 01 to test functionality
-        TwoNIntercomHoldSwitch(coordinator, 1, f"{coordinator.device_name} Switch 01 Hold"),
-    ]
-
-    # Add additional port/hold switches if available
-    for switch_id, switch_info in enumerate(coordinator.data.get("ports", []), start=2):
-        # Normal switch
+    switches: list[SwitchEntity] = [TwoNIntercomDoorSwitch(coordinator)]
+
+    # Ports come from the capabilities; ids already given entities
+    known_ids: set[int] = set()
+
+    def _entities_for_new_ports() -> list[SwitchEntity]:
+        """Build entities for ports that have no entity yet."""
+        ports = coordinator.ports_by_id
+        new_ids = sorted(ports.keys() - known_ids)
+        known_ids.update(new_ids)
+        names = {i: ports[i].get("name") or f"Switch {i}" for i in new_ids}
+
+        # Normal switches, plus a hold switch for every bistable port
+        entities: list[SwitchEntity] = [
+            TwoNIntercomSwitch(coordinator, i, names[i]) for i in new_ids
+        ]
+        entities += [
+            TwoNIntercomHoldSwitch(coordinator, i, f"{names[i]} Hold")
+            for i in new_ids
+            if ports[i].get("mode") == "bistable"
+        ]
+        return entities
+
+    switches.extend(_entities_for_new_ports())
+    if not known_ids:
+        # No capabilities reported yet; every model has at least Switch 01
+        known_ids.add(1)
         switches.append(
-            TwoNIntercomSwitch(
-                coordinator,
-                switch_id,
-                switch_info.get("name", f"Switch {switch_id}"),
-            )
+            TwoNIntercomSwitch(coordinator, 1, f"{coordinator.device_name} Switch 01")
         )
 
-        # Add hold switch if bistable
-        if switch_info.get("mode") == "bistable":
-            switches.append(
-                TwoNIntercomHoldSwitch(
-                    coordinator,
-                    switch_id,
-                    f"{switch_info.get('name', f'Switch {switch_id}')} Hold",
-                )
-            )
+    async_add_entities(switches)
 
-    # Debug logging to see what switches are being created
-    _LOGGER.debug("Creating %d switches for %s", len(switches), coordinator.device_name)
-    for switch in switches:
-        _LOGGER.debug("Switch: %s (ID: %s)", switch.name, switch.unique_id)
+    @callback
+    def _async_add_new_ports() -> None:
+        """Add entities for ports that appear after setup, e.g. after a firmware update."""
+        if coordinator.ports_by_id.keys() - known_ids:
+            async_add_entities(_entities_for_new_ports())
 
-    async_add_entities(switches)
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_ports))
 
 
-class TwoNIntercomDoorSwitch(CoordinatorEntity, SwitchEntity):
-    """Representation of a 2N IP Intercom door switch."""
+class TwoNIntercomControlSwitch(CoordinatorEntity, SwitchEntity):
+    """Base for on/off entities driven through a 2N control endpoint.
 
-    def __init__(self, coordinator: TwoNIntercomDataUpdateCoordinator) -> None:
-        super().__init__(coordinator)
-        self._attr_name = f"{coordinator.device_name} Door"
-        self._attr_unique_id = f"{coordinator.host}_door"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.host)},
-            name=coordinator.device_name,
-            manufacturer="2N",
-            model="IP Intercom",
-        )
+    Subclasses set the coordinator data key holding the state, the values
+    the device reports for on and off, and one encoded URL per action.
+    """
+
+    _on_value = "on"
+    _off_value = "off"
+    _state_key: str
+    _target: str
+    _action_urls: dict[str, URL]
 
     @property
-    def is_on(self) -> bool:
-        return self.coordinator.data.get("doorState") == "unlocked"
+    def is_on(self) -> bool | None:
+        # Unknown rather than off when the last poll did not report this output
+        if (state := self.coordinator.data.get(self._state_key)) is None:
+            return None
+        return state == self._on_value
 
     async def async_turn_on(self, **kwargs) -> None:
-        await self._send_door_action("on")
+        await self._send_action("on")
 
     async def async_turn_off(self, **kwargs) -> None:
-        await self._send_door_action("off")
-
-    async def _send_door_action(self, action: str) -> None:
-        async with aiohttp.ClientSession() as session:
-            auth = (
-                aiohttp.BasicAuth(self.coordinator.username, self.coordinator.password)
-                if self.coordinator.username and self.coordinator.password
-                else None
-            )
-            await session.get(
-                f"{self.coordinator.base_url}{API_DOOR_CONTROL}",
-                params={"switch": "1", "action": action},
-                auth=auth,
+        await self._send_action("off")
+
+    async def _send_action(self, action: str) -> None:
+        try:
+            status = await self.coordinator.async_send_command(self._action_urls[action])
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise HomeAssistantError(
+                f"Failed to send action '{action}' to {self._target}: {err}"
+            ) from err
+        if status != 200:
+            _LOGGER.warning(
+                "Failed to send action '%s' to %s, HTTP status %s",
+                action,
+                self._target,
+                status,
             )
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh()
+            return
+        # The device accepted the command; show it until the next poll
+        self.coordinator.async_set_optimistic_state(
+            self._state_key, self._on_value if action == "on" else self._off_value
+        )
+
+
+class TwoNIntercomDoorSwitch(TwoNIntercomControlSwitch):
+    """Representation of a 2N IP Intercom door switch."""
 
+    _on_value = "unlocked"
+    _off_value = "locked"
+    _state_key = "doorState"
+    _target = "door"
 
-class TwoNIntercomSwitch(CoordinatorEntity, SwitchEntity):
+    def __init__(self, coordinator: TwoNIntercomDataUpdateCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_name = f"{coordinator.device_name} Door"
+        self._attr_unique_id = f"{coordinator.host}_door"
+        self._attr_device_info = coordinator.device_info
+        # Fully encoded per action so a press sends a ready-made URL
+        self._action_urls = {
+            action: coordinator.door_url.with_query(switch="1", action=action)
+            for action in ("on", "off")
+        }
+
+
+class TwoNIntercomSwitch(TwoNIntercomControlSwitch):
     """Representation of a 2N IP Intercom switch."""
 
     def __init__(
@@ -111,38 +149,16 @@ class TwoNIntercomSwitch(CoordinatorEntity, SwitchEntity):
     ) -> None:
         super().__init__(coordinator)
         self._switch_id = switch_id
+        self._state_key = f"switch{switch_id}State"
+        self._target = f"switch {switch_id}"
+        # Fully encoded per action so a press sends a ready-made URL
+        self._action_urls = {
+            action: coordinator.switch_url.with_query(switch=str(switch_id), action=action)
+            for action in ("on", "off")
+        }
         self._attr_name = name
         self._attr_unique_id = f"{coordinator.host}_switch_{switch_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.host)},
-            name=coordinator.device_name,
-            manufacturer="2N",
-            model="IP Intercom",
-        )
-
-    @property
-    def is_on(self) -> bool:
-        return self.coordinator.data.get(f"switch{self._switch_id}State") == "on"
-
-    async def async_turn_on(self, **kwargs) -> None:
-        await self._send_switch_action("on")
-
-    async def async_turn_off(self, **kwargs) -> None:
-        await self._send_switch_action("off")
-
-    async def _send_switch_action(self, action: str) -> None:
-        async with aiohttp.ClientSession() as session:
-            auth = (
-                aiohttp.BasicAuth(self.coordinator.username, self.coordinator.password)
-                if self.coordinator.username and self.coordinator.password
-                else None
-            )
-            await session.get(
-                f"{self.coordinator.base_url}{API_SWITCH_CONTROL}",
-                params={"switch": str(self._switch_id), "action": action},
-                auth=auth,
-            )
-        await self.coordinator.async_request_refresh()
+        self._attr_device_info = coordinator.device_info
 
 
 class TwoNIntercomHoldSwitch(CoordinatorEntity, SwitchEntity):
@@ -151,15 +167,16 @@ class TwoNIntercomHoldSwitch(CoordinatorEntity, SwitchEntity):
     def __init__(self, coordinator: TwoNIntercomDataUpdateCoordinator, switch_id: int, name: str) -> None:
         super().__init__(coordinator)
         self._switch_id = switch_id
+        self._action_urls = {
+            action: coordinator.switch_url.with_query(switch=str(switch_id), action=action)
+            for action in ("hold", "release")
+        }
         self._attr_name = name
         self._attr_unique_id = f"{coordinator.host}_hold_switch_{switch_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.host)},
-            name=coordinator.device_name,
-            manufacturer="2N",
-            model="IP Intercom",
-        )
+        self._attr_device_info = coordinator.device_info
         self._state = False
+        # Keeps hold and release reaching the device in the order they were pressed
+        self._send_lock = asyncio.Lock()
 
     @property
     def is_on(self) -> bool:
@@ -174,55 +191,37 @@ class TwoNIntercomHoldSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Send hold action and maintain state until manually turned off."""
         try:
-            await self._send_action("hold")
-            self._state = True
-            self.async_write_ha_state()
-            _LOGGER.info("Hold switch %s activated", self._switch_id)
-        except Exception as e:
+            if not await self._send_action("hold"):
+                return
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             _LOGGER.error("Failed to hold switch %s: %s", self._switch_id, e)
+            return
+        self._state = True
+        self.async_write_ha_state()
+        _LOGGER.info("Hold switch %s activated", self._switch_id)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Send release action to turn off the hold switch."""
         try:
-            await self._send_action("release")
-            self._state = False
-            self.async_write_ha_state()
-            _LOGGER.info("Hold switch %s released", self._switch_id)
-        except Exception as e:
+            if not await self._send_action("release"):
+                return
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             _LOGGER.error("Failed to release switch %s: %s", self._switch_id, e)
-
-    async def _send_action(self, action: str) -> None:
-        """Send hold or release action to the 2N switch."""
-        params = {"switch": str(self._switch_id), "action": action}
-
-        # Reuse session from coordinator if available, otherwise create new session
-        session = getattr(self.coordinator, "_aiohttp_session", None)
-        close_session = False
-        if session is None:
-            session = aiohttp.ClientSession()
-            close_session = True
-
-        try:
-            auth = (
-                aiohttp.BasicAuth(self.coordinator.username, self.coordinator.password)
-                if self.coordinator.username and self.coordinator.password
-                else None
+            return
+        self._state = False
+        self.async_write_ha_state()
+        _LOGGER.info("Hold switch %s released", self._switch_id)
+
+    async def _send_action(self, action: str) -> bool:
+        """Send hold or release action to the 2N switch; return whether it was accepted."""
+        async with self._send_lock:
+            status = await self.coordinator.async_send_command(self._action_urls[action])
+        if status != 200:
+            _LOGGER.warning(
+                "Failed to send action '%s' to switch %s, HTTP status %s",
+                action,
+                self._switch_id,
+                status,
             )
-            async with session.get(
-                f"{self.coordinator.base_url}{API_SWITCH_CONTROL}",
-                params=params,
-                auth=auth,
-            ) as resp:
-                if resp.status != 200:
-                    _LOGGER.warning(
-                        "Failed to send action '%s' to switch %s, HTTP status %s",
-                        action,
-                        self._switch_id,
-                        resp.status,
-                    )
-        finally:
-            if close_session:
-                await session.close()
-
-        # Don't refresh coordinator immediately to prevent state conflicts
-        # await self.coordinator.async_request_refresh()
\ No newline at end of file
+            return False
+        return True
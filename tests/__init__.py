@@ -0,0 +1 @@
+"""Tests for the 2N IP Intercom integration."""
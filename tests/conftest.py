@@ -0,0 +1,32 @@
+"""Fixtures for the 2N IP Intercom tests."""
+import importlib
+
+import pytest
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+# The package name starts with a digit, so it can only be imported dynamically
+integration = importlib.import_module("custom_components.2n_ip_intercom")
+const = importlib.import_module("custom_components.2n_ip_intercom.const")
+coordinator_module = importlib.import_module(
+    "custom_components.2n_ip_intercom.coordinator"
+)
+
+HOST = "192.0.2.10"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the custom integration in every test."""
+    yield
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant):
+    """Return a coordinator for a test device, shut down after the test."""
+    coordinator = coordinator_module.TwoNIntercomDataUpdateCoordinator(
+        hass, {CONF_HOST: HOST}
+    )
+    yield coordinator
+    await coordinator.async_shutdown()
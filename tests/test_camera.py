@@ -0,0 +1,96 @@
+"""Tests for the 2N IP Intercom camera."""
+import asyncio
+import importlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+camera_module = importlib.import_module("custom_components.2n_ip_intercom.camera")
+
+IMAGE = b"\xff\xd8jpeg\xff\xd9"
+
+
+def _mock_session(read=None):
+    """Return a session whose snapshot request answers 200 with IMAGE."""
+    response = MagicMock(status=200, content_length=None)
+    response.read = read or AsyncMock(return_value=IMAGE)
+    session = MagicMock()
+    session.get.return_value.__aenter__.return_value = response
+    return session
+
+
+@pytest.fixture
+def camera(hass: HomeAssistant, coordinator):
+    """Return a camera entity bound to hass."""
+    camera = camera_module.TwoNCamera(coordinator, 1)
+    camera.hass = hass
+    return camera
+
+
+async def test_concurrent_requests_share_one_fetch(camera, coordinator):
+    """Callers arriving while a snapshot is in flight wait for that snapshot."""
+    release = asyncio.Event()
+
+    async def read():
+        await release.wait()
+        return IMAGE
+
+    session = _mock_session(read=read)
+    with patch.object(coordinator, "async_get_session", AsyncMock(return_value=session)):
+        tasks = [asyncio.create_task(camera.async_camera_image()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*tasks)
+
+    assert images == [IMAGE, IMAGE, IMAGE]
+    assert session.get.call_count == 1
+
+
+async def test_snapshot_cached_for_ttl(camera, coordinator):
+    """A snapshot is served from memory until the cache TTL has passed."""
+    session = _mock_session()
+    with patch.object(coordinator, "async_get_session", AsyncMock(return_value=session)):
+        assert await camera.async_camera_image() == IMAGE
+        assert await camera.async_camera_image() == IMAGE
+        assert session.get.call_count == 1
+
+        camera._last_image_ts -= camera_module.SNAPSHOT_CACHE_TTL
+        assert await camera.async_camera_image() == IMAGE
+        assert session.get.call_count == 2
+
+
+async def test_failures_back_off_requests(hass: HomeAssistant, camera, coordinator):
+    """Failed snapshots hold off further requests with a growing delay."""
+    session = MagicMock()
+    session.get.side_effect = aiohttp.ClientError("offline")
+    with patch.object(coordinator, "async_get_session", AsyncMock(return_value=session)):
+        assert await camera.async_camera_image() is None
+        assert camera._consecutive_failures == 1
+        assert camera._next_retry_at - hass.loop.time() == pytest.approx(2, abs=0.5)
+
+        # Still inside the retry window, so the device is not asked again
+        assert await camera.async_camera_image() is None
+        assert session.get.call_count == 1
+
+        camera._next_retry_at = 0.0
+        assert await camera.async_camera_image() is None
+        assert session.get.call_count == 2
+        assert camera._next_retry_at - hass.loop.time() == pytest.approx(4, abs=0.5)
+
+        camera._consecutive_failures = 10
+        camera._next_retry_at = 0.0
+        await camera.async_camera_image()
+        assert camera._next_retry_at - hass.loop.time() == pytest.approx(
+            camera_module.SNAPSHOT_MAX_BACKOFF, abs=0.5
+        )
+
+        # A successful snapshot clears the back-off
+        session.get.side_effect = None
+        session.get.return_value = _mock_session().get.return_value
+        camera._next_retry_at = 0.0
+        assert await camera.async_camera_image() == IMAGE
+        assert camera._consecutive_failures == 0
+        assert camera._next_retry_at == 0.0
@@ -0,0 +1,61 @@
+"""Tests for the 2N IP Intercom config flow."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from .conftest import HOST, const, coordinator_module, integration
+
+
+async def _fetch(self, path):
+    """Answer every poll with a minimal, unchanging device status."""
+    if path == const.API_SYSTEM_STATUS:
+        return {"deviceName": "Intercom"}
+    if path == const.API_SWITCH_CAPS:
+        return {"ports": []}
+    return {}
+
+
+async def test_options_apply_to_coordinator(hass: HomeAssistant):
+    """Saving the options reloads the entry with the new interval and pool size."""
+    entry = MockConfigEntry(domain=const.DOMAIN, data={CONF_HOST: HOST})
+    entry.add_to_hass(hass)
+
+    with patch.object(integration, "PLATFORMS", []), patch.object(
+        coordinator_module.TwoNIntercomDataUpdateCoordinator, "_fetch", _fetch
+    ), patch(
+        "homeassistant.helpers.storage.Store.async_delay_save"
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "init"
+
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={CONF_SCAN_INTERVAL: 15, const.CONF_PARALLEL_REQUESTS: True},
+        )
+        await hass.async_block_till_done()
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert entry.options == {
+            CONF_SCAN_INTERVAL: 15,
+            const.CONF_PARALLEL_REQUESTS: True,
+        }
+        assert entry.state is ConfigEntryState.LOADED
+
+        coordinator = hass.data[const.DOMAIN][entry.entry_id]
+        assert coordinator.update_interval == timedelta(seconds=15)
+        session = await coordinator.async_get_session()
+        assert session.connector.limit == 2
+        assert session.connector.limit_per_host == 2
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+    assert session.closed
@@ -0,0 +1,212 @@
+"""Tests for the 2N IP Intercom coordinator."""
+import asyncio
+from datetime import timedelta
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.const import CONF_HOST
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .conftest import HOST, const, coordinator_module, integration
+
+STORAGE_KEY = f"{const.DOMAIN}_{HOST}"
+STORED_DATA = {
+    "deviceName": "Intercom",
+    "ports": [{"id": 1, "name": "Switch 01", "mode": "monostable", "enabled": True}],
+    "switch1State": "off",
+}
+
+
+def _stored(data):
+    """Return a storage file as written by the coordinator's Store."""
+    return {
+        "version": coordinator_module.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": data,
+    }
+
+
+async def test_switch_actions_sent_in_turn_with_single_refresh(coordinator, caplog):
+    """A failing command is logged and skipped; the batch refreshes once."""
+    sent = []
+
+    async def send_command(url):
+        sent.append((url.query["switch"], url.query["action"]))
+        if url.query["switch"] == "2":
+            raise asyncio.TimeoutError
+        return 200
+
+    with patch.object(
+        coordinator, "async_send_command", side_effect=send_command
+    ), patch.object(
+        coordinator, "async_request_refresh", AsyncMock()
+    ) as request_refresh, caplog.at_level(logging.WARNING):
+        await coordinator.async_send_switch_actions([(1, "on"), (2, "on"), (3, "on")])
+
+    assert sent == [("1", "on"), ("2", "on"), ("3", "on")]
+    request_refresh.assert_awaited_once()
+    assert "Failed to send action 'on' to switch 2" in caplog.text
+
+
+async def test_first_refresh_prefers_live_state(coordinator, hass_storage):
+    """A reachable device is polled at startup; the stored state is ignored."""
+    hass_storage[STORAGE_KEY] = _stored(STORED_DATA)
+    live = {"deviceName": "Intercom", "switch1State": "on"}
+
+    with patch.object(coordinator, "_async_fetch_status", return_value=live):
+        await coordinator.async_config_entry_first_refresh()
+
+    assert coordinator.data == live
+    assert coordinator.last_update_success
+
+
+async def test_first_refresh_falls_back_to_stored_state(coordinator, hass_storage, caplog):
+    """An unreachable device starts from the stored state, marked unavailable."""
+    hass_storage[STORAGE_KEY] = _stored(STORED_DATA)
+
+    with patch.object(
+        coordinator, "_async_fetch_status", side_effect=UpdateFailed("offline")
+    ), caplog.at_level(logging.WARNING):
+        await coordinator.async_config_entry_first_refresh()
+
+    assert coordinator.data == STORED_DATA
+    assert not coordinator.last_update_success
+    assert list(coordinator.ports_by_id) == [1]
+    assert "starting from its last known state" in caplog.text
+
+
+async def test_first_refresh_without_stored_state_not_ready(coordinator):
+    """Without a stored state an unreachable device fails setup."""
+    with patch.object(
+        coordinator, "_async_fetch_status", side_effect=UpdateFailed("offline")
+    ), pytest.raises(ConfigEntryNotReady):
+        await coordinator.async_config_entry_first_refresh()
+
+
+async def test_first_refresh_rejected_credentials_not_ready(coordinator, hass_storage):
+    """Rejected credentials fail setup even when a stored state exists."""
+    hass_storage[STORAGE_KEY] = _stored(STORED_DATA)
+    err = UpdateFailed("Invalid authentication credentials")
+    err.__cause__ = coordinator_module.InvalidAuth()
+
+    with patch.object(
+        coordinator, "_async_fetch_status", side_effect=err
+    ), pytest.raises(ConfigEntryNotReady):
+        await coordinator.async_config_entry_first_refresh()
+
+    assert coordinator.data is None
+
+
+async def test_changed_state_is_saved(hass, coordinator, hass_storage):
+    """A poll that changes the state is written to the store; an unchanged one is not."""
+
+    async def fetch(path):
+        if path == const.API_SYSTEM_STATUS:
+            return {"deviceName": "Intercom"}
+        if path == const.API_SWITCH_STATUS:
+            return {"switch1State": "on"}
+        return {"ports": []}
+
+    with patch.object(coordinator, "_fetch", side_effect=fetch):
+        await coordinator.async_refresh()
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow() + timedelta(seconds=coordinator_module.STORAGE_SAVE_DELAY + 1),
+        )
+        await hass.async_block_till_done()
+        assert hass_storage[STORAGE_KEY]["data"] == coordinator.data
+
+        with patch.object(coordinator._store, "async_delay_save") as delay_save:
+            await coordinator.async_refresh()
+        delay_save.assert_not_called()
+
+
+async def test_remove_entry_deletes_store(hass, hass_storage):
+    """Deleting the config entry removes the stored state of its device."""
+    hass_storage[STORAGE_KEY] = _stored(STORED_DATA)
+    entry = MockConfigEntry(domain=const.DOMAIN, data={CONF_HOST: HOST})
+
+    await integration.async_remove_entry(hass, entry)
+
+    assert STORAGE_KEY not in hass_storage
+
+
+async def test_failures_double_interval_up_to_max(coordinator):
+    """Each failed poll doubles the interval until it reaches the ceiling."""
+    base = const.DEFAULT_SCAN_INTERVAL
+    intervals = []
+
+    with patch.object(
+        coordinator, "_async_fetch_status", side_effect=UpdateFailed("offline")
+    ), patch.object(coordinator_module.random, "randint", return_value=0):
+        for _ in range(6):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+            intervals.append(coordinator.update_interval.total_seconds())
+
+    expected, backoff = [], base
+    for _ in range(6):
+        backoff = min(coordinator_module.MAX_FAILURE_BACKOFF, backoff * 2)
+        expected.append(backoff)
+    assert intervals == expected
+    assert intervals[-1] == coordinator_module.MAX_FAILURE_BACKOFF
+
+
+async def test_failure_jitter_stays_within_a_quarter(coordinator):
+    """The jittered interval never exceeds the backoff or drops below 3/4 of it."""
+    with patch.object(
+        coordinator, "_async_fetch_status", side_effect=UpdateFailed("offline")
+    ):
+        for _ in range(50):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+            backoff = coordinator._failure_backoff
+            interval = coordinator.update_interval.total_seconds()
+            assert backoff - backoff // 4 <= interval <= backoff
+
+
+async def test_success_restores_base_interval(coordinator):
+    """A successful poll after failures returns to the configured interval."""
+    with patch.object(
+        coordinator, "_async_fetch_status", side_effect=UpdateFailed("offline")
+    ):
+        for _ in range(3):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+    assert coordinator.update_interval > timedelta(seconds=const.DEFAULT_SCAN_INTERVAL)
+
+    with patch.object(coordinator, "_async_fetch_status", return_value={}):
+        await coordinator._async_update_data()
+
+    assert coordinator.update_interval == timedelta(seconds=const.DEFAULT_SCAN_INTERVAL)
+    assert coordinator._failure_backoff == const.DEFAULT_SCAN_INTERVAL
+
+
+async def test_firmware_change_updates_device_registry(hass, coordinator):
+    """New firmware details reach the registry without editing the shared DeviceInfo."""
+    entry = MockConfigEntry(domain=const.DOMAIN, data={CONF_HOST: HOST})
+    entry.add_to_hass(hass)
+    handed_out = coordinator.device_info
+    registry = dr.async_get(hass)
+    device = registry.async_get_or_create(config_entry_id=entry.entry_id, **handed_out)
+
+    coordinator._update_device_info({"variant": "IP Verso", "swVersion": "2.40.0"})
+
+    device = registry.async_get(device.id)
+    assert device.model == "IP Verso"
+    assert device.sw_version == "2.40.0"
+    assert "sw_version" not in handed_out
+
+    with patch.object(registry, "async_update_device") as update_device:
+        coordinator._update_device_info({"variant": "IP Verso", "swVersion": "2.40.0"})
+    update_device.assert_not_called()
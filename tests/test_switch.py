@@ -0,0 +1,118 @@
+"""Tests for the 2N IP Intercom switches."""
+import importlib
+from unittest.mock import MagicMock, patch
+
+from .conftest import const, coordinator_module
+
+switch_module = importlib.import_module("custom_components.2n_ip_intercom.switch")
+
+
+async def test_optimistic_state_survives_next_refresh(coordinator):
+    """A refresh after a command keeps the state the device now reports."""
+    device = {"active": False}
+    fetched = []
+
+    async def fetch(path):
+        fetched.append(path)
+        if path == const.API_SYSTEM_STATUS:
+            return {"deviceName": "Intercom"}
+        if path == const.API_SWITCH_CAPS:
+            return {"ports": [{"id": 1, "name": "Switch 01", "mode": "monostable", "enabled": True}]}
+        return coordinator_module._parse_switch_status(
+            {"switches": [{"switch": 1, "active": device["active"]}]}
+        )
+
+    async def send_command(url):
+        device["active"] = url.query["action"] == "on"
+        return 200
+
+    entity = switch_module.TwoNIntercomSwitch(coordinator, 1, "Switch 01")
+    with patch.object(coordinator, "_fetch", side_effect=fetch), patch.object(
+        coordinator, "async_send_command", side_effect=send_command
+    ), patch.object(coordinator._store, "async_delay_save"):
+        await coordinator.async_refresh()
+        assert entity.is_on is False
+
+        await entity.async_turn_on()
+        assert entity.is_on is True
+
+        fetched.clear()
+        await coordinator.async_refresh()
+
+    # The caps are not due again, so the state can only come from the live poll
+    assert const.API_SWITCH_CAPS not in fetched
+    assert entity.is_on is True
+
+
+async def test_poll_replaces_optimistic_state(coordinator):
+    """A monostable port that already pulsed back shows off after the next poll."""
+
+    async def fetch(path):
+        if path == const.API_SYSTEM_STATUS:
+            return {"deviceName": "Intercom"}
+        if path == const.API_SWITCH_CAPS:
+            return {"ports": [{"id": 1, "name": "Switch 01", "mode": "monostable", "enabled": True}]}
+        return {"switch1State": "off"}
+
+    entity = switch_module.TwoNIntercomSwitch(coordinator, 1, "Switch 01")
+    with patch.object(coordinator, "_fetch", side_effect=fetch), patch.object(
+        coordinator, "async_send_command", return_value=200
+    ), patch.object(coordinator._store, "async_delay_save"):
+        await coordinator.async_refresh()
+        polled = coordinator.data
+
+        with patch.object(coordinator, "_schedule_refresh") as schedule_refresh:
+            await entity.async_turn_on()
+        assert entity.is_on is True
+        # The commanded state neither edits the polled data nor delays the poll
+        assert polled["switch1State"] == "off"
+        schedule_refresh.assert_not_called()
+
+        await coordinator.async_refresh()
+
+    assert entity.is_on is False
+
+
+async def test_hold_switch_keeps_state_when_rejected(coordinator):
+    """The hold switch only changes state when the device accepts the command."""
+    entity = switch_module.TwoNIntercomHoldSwitch(coordinator, 2, "Switch 02 Hold")
+    entity.async_write_ha_state = MagicMock()
+
+    with patch.object(coordinator, "async_send_command", return_value=500):
+        await entity.async_turn_on()
+    assert entity.is_on is False
+
+    with patch.object(coordinator, "async_send_command", return_value=200):
+        await entity.async_turn_on()
+    assert entity.is_on is True
+
+    with patch.object(coordinator, "async_send_command", return_value=403):
+        await entity.async_turn_off()
+    assert entity.is_on is True
+
+
+async def test_setup_builds_ports_from_caps(hass, coordinator):
+    """Port entities follow the capabilities, with Switch 01 only as a fallback."""
+    entry = MagicMock(entry_id="test")
+    hass.data[const.DOMAIN] = {entry.entry_id: coordinator}
+
+    async def setup(ports):
+        coordinator._index_ports(ports)
+        add_entities = MagicMock()
+        await switch_module.async_setup_entry(hass, entry, add_entities)
+        return sorted(entity.unique_id for entity in add_entities.call_args.args[0])
+
+    assert await setup([]) == [
+        f"{coordinator.host}_door",
+        f"{coordinator.host}_switch_1",
+    ]
+    assert await setup(
+        [
+            {"id": 1, "name": "Gate", "mode": "monostable", "enabled": False},
+            {"id": 2, "name": "Lock", "mode": "bistable", "enabled": True},
+        ]
+    ) == [
+        f"{coordinator.host}_door",
+        f"{coordinator.host}_hold_switch_2",
+        f"{coordinator.host}_switch_2",
+    ]